@@ -60,8 +60,8 @@ Create {num_scenes} visually stunning scenes. These are for a VERTICAL 9:16 vide
 
 Locations available: {', '.join(domain.locations)}
 Signature elements: {', '.join(domain.signature_elements[:8])}
-Color palette: {', '.join(domain.color_palette)}
-Mood: {', '.join(domain.mood_keywords)}
+Color palette: {domain.palette_str}
+Mood: {domain.mood_str}
 
 Return ONLY valid JSON:
 {{
@@ -96,10 +96,7 @@ Return ONLY valid JSON:
         random.shuffle(scenes)
         for i, s in enumerate(scenes, 1):
             s["scene_number"] = i
-            s["camera_movement"] = random.choices(
-                list(domain.camera_weights.keys()),
-                weights=list(domain.camera_weights.values()),
-            )[0]
+            s["camera_movement"] = domain.sample_camera()
         return scenes
 
     # ------------------------------------------------------------------ #
@@ -112,7 +109,7 @@ Return ONLY valid JSON:
         mood = scene.get("mood", domain.mood_keywords[0])
         return (
             f"{desc}. {lighting} lighting. Mood: {mood}. Key elements: {elements}. "
-            f"{domain.style_prompt}. Color palette: {', '.join(domain.color_palette)}. "
+            f"{domain.style_prompt}. Color palette: {domain.palette_str}. "
             f"{self.base_style}. Vertical portrait composition, tall framing."
         )
 
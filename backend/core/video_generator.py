@@ -95,8 +95,8 @@ REQUIREMENTS:
 4. Include these signature elements: {elements_str}
 5. Make each scene visually distinct but thematically connected
 
-Color Palette: {', '.join(domain.color_palette)}
-Mood: {', '.join(domain.mood_keywords)}
+Color Palette: {domain.palette_str}
+Mood: {domain.mood_str}
 
 Return ONLY valid JSON:
 {{
@@ -138,10 +138,7 @@ Return ONLY valid JSON:
         # Assign camera movements using domain weights
         for i, scene in enumerate(scenes, 1):
             scene['scene_number'] = i
-            scene['camera_movement'] = random.choices(
-                list(domain.camera_weights.keys()),
-                weights=list(domain.camera_weights.values())
-            )[0]
+            scene['camera_movement'] = domain.sample_camera()
         
         # Store video identity on scenes for use in image prompts, and record it
         if video_identity:
@@ -365,12 +362,12 @@ Return only valid JSON."""},
 {weather} weather. Shot from {perspective} angle.
 Mood: {mood}. Theme: {narrative}.
 Key elements: {elements}.
-{domain.style_prompt}. Color palette: {', '.join(domain.color_palette)}.
+{domain.style_prompt}. Color palette: {domain.palette_str}.
 {self.base_style}. {domain.name} cinematography."""
         else:
             prompt = f"""{description}. {lighting} lighting. 
 Mood: {mood}. Key elements: {elements}.
-{domain.style_prompt}. Color palette: {', '.join(domain.color_palette)}.
+{domain.style_prompt}. Color palette: {domain.palette_str}.
 {self.base_style}. {domain.name} cinematography."""
         
         return prompt.strip()
@@ -0,0 +1,40 @@
+"""
+Weighted sampling helpers for domain data
+"""
+import random
+from typing import Sequence
+
+
+class AliasSampler:
+    """Vose alias table: O(n) build once, O(1) per weighted draw."""
+
+    __slots__ = ("_prob", "_alias")
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        total = sum(weights)
+        if n == 0 or total <= 0:
+            raise ValueError("weights must be non-empty with a positive sum")
+
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Whatever is left over is 1.0 up to float rounding
+        self._prob = prob
+        self._alias = alias
+
+    def __len__(self) -> int:
+        return len(self._prob)
+
+    def sample(self, rng=random) -> int:
+        """Draw one index. `rng` is anything with a random() method (the random module, random.Random)."""
+        i = int(rng.random() * len(self._prob))
+        return i if rng.random() < self._prob[i] else self._alias[i]
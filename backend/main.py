@@ -17,14 +17,14 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from domains import DOMAIN_REGISTRY
+from domains import DOMAIN_REGISTRY, get_domain_json
 from core.video_generator import VideoGenerator
 from utils.file_manager import FileManager
 from utils.youtube_upload import upload_video as yt_upload_video, set_thumbnail as yt_set_thumbnail
@@ -352,13 +352,8 @@ async def get_domains():
 async def get_domain(domain_name: str):
     if domain_name not in DOMAIN_REGISTRY:
         raise HTTPException(status_code=404, detail={"error": "not_found", "detail": "Domain not found", "code": "DOMAIN_NOT_FOUND"})
-    domain = DOMAIN_REGISTRY[domain_name]
-    return {
-        "name": domain.name, "icon": domain.icon, "description": domain.description,
-        "locations": domain.locations, "signature_elements": domain.signature_elements,
-        "lighting_conditions": domain.lighting_conditions, "color_palette": domain.color_palette,
-        "mood_keywords": domain.mood_keywords
-    }
+    # Read-only metadata: serve the cached payload instead of re-encoding per request
+    return Response(content=get_domain_json(domain_name), media_type="application/json")
 
 # ============== Music Endpoints ==============
 
@@ -56,8 +56,8 @@ class FileManager:
 {duration} seconds ({duration // 60}:{duration % 60:02d})
 
 🎨 STYLE
-Color Palette: {', '.join(domain.color_palette)}
-Mood: {', '.join(domain.mood_keywords)}
+Color Palette: {domain.palette_str}
+Mood: {domain.mood_str}
 Lighting: {', '.join(domain.lighting_conditions)}
 
 📊 VIDEO DETAILS